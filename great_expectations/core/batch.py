@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
-import datetime
+import hashlib
 import json
 import logging
+import sys
+import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Type, Union
 
 import great_expectations.exceptions as gx_exceptions
@@ -25,6 +27,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+    logger.debug(
+        "Unable to load orjson; falling back to the standard library json module for serialization."
+    )
+
 try:
     import pandas as pd
 except ImportError:
@@ -45,6 +56,112 @@ except ImportError:
     )
 
 
+def _intern_if_str(value: Any) -> Any:
+    """Intern string values so repeated names share storage and compare by pointer.
+
+    Deployments typically reuse a handful of datasource/data connector/data asset names across
+    many thousands of BatchDefinition/BatchRequest instances; interning collapses those copies
+    and makes the equality and hashing of the names (e.g., in caches keyed by name) cheap.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _id_from_json_dict(json_dict: dict) -> str:
+    """Compute the ID of an already-JSON-serializable dict.
+
+    Produces the same digest as IDDict(json_dict).to_id(), but skips the redundant
+    "convert_to_json_serializable" traversal that "to_id()" performs -- the dicts passed here come
+    straight out of "to_json_dict()" and are JSON-safe by construction.  Callers must guarantee
+    at least two keys (the single-key and empty special cases of "to_id()" are not reproduced).
+    """
+    return hashlib.md5(
+        json.dumps(json_dict, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _batch_markers_ge_load_time() -> str:
+    """Format the current UTC time as "%Y%m%dT%H%M%S.%fZ" (e.g., "20220101T123456.000789Z").
+
+    Formatting manually from "time.time_ns()" is several times faster than
+    datetime.datetime.now(datetime.timezone.utc).strftime() with a "%f" directive, and Batch
+    construction computes this timestamp whenever batch_markers are not supplied.
+    """
+    seconds: int
+    remainder_ns: int
+    seconds, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(seconds))}.{remainder_ns // 1000:06d}Z"
+
+
+def _dumps_indented(obj: dict) -> str:
+    """Serialize a JSON-serializable dict to an indented string.
+
+    Uses "orjson" (when available) for speed, because this runs in hot logging and
+    stringification paths; the output format is identical to json.dumps(obj, indent=2).
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    return json.dumps(obj, indent=2)
+
+
+# Error-message templates for the argument checkers below.  Defined once at module level so the
+# raise paths reuse the same interned template (formatting "type(value)" with "!r" produces the
+# same rendering as "str(type(value))" without the extra str() call).
+_STR_TYPE_ERROR_TEMPLATE: str = """The type of {name} must be a string (Python "str").  The type given is
+"{value_type!r}", which is illegal.
+"""
+_DICT_TYPE_ERROR_TEMPLATE: str = """The type of {name} must be a dict object.  The type given is
+"{value_type!r}", which is illegal.
+"""
+_INT_TYPE_ERROR_TEMPLATE: str = """The type of {name} must be an integer (Python "int").  The type given is
+"{value_type!r}", which is illegal.
+"""
+_BATCH_IDENTIFIERS_TYPE_ERROR_TEMPLATE: str = """The type of batch_identifiers must be an IDDict object.  The type given is \
+"{value_type!r}", which is illegal.
+"""
+_RUNTIME_PARAMETERS_TYPE_ERROR_TEMPLATE: str = """The runtime_parameters must be a non-empty dict object.
+                The type given is "{value_type!r}", which is an illegal type or an empty dictionary."""
+_RUNTIME_BATCH_IDENTIFIERS_TYPE_ERROR_TEMPLATE: str = """The type for batch_identifiers must be a dict object, with keys being identifiers defined in the
+                data connector configuration.  The type given is "{value_type!r}", which is illegal."""
+_BATCH_SPEC_PASSTHROUGH_TYPE_ERROR_TEMPLATE: str = """The type for batch_spec_passthrough must be a dict object. The type given is \
+"{value_type!r}", which is illegal.
+"""
+
+
+def _check_str_arg(name: str, value: Any, required: bool = False) -> None:
+    """Raise TypeError unless "value" is a string (and, if "required", a non-empty one).
+
+    "name" is the human-readable phrase rendered into the error message (e.g. "an datasource
+    name") -- callers supply the exact wording their messages have always used.
+
+    Defined at module level (rather than inline in each validator) so that BatchRequest and
+    BatchDefinition construction -- a hot path for partition enumeration and profiling -- shares a
+    single code object instead of repeating the same three-line isinstance/raise block per field.
+    """
+    if (required and not value) or (value and not isinstance(value, str)):
+        raise TypeError(
+            _STR_TYPE_ERROR_TEMPLATE.format(name=name, value_type=type(value))
+        )
+
+
+def _check_dict_arg(name: str, value: Any) -> None:
+    """Raise TypeError if a truthy "value" is not a dictionary."""
+    if value and not isinstance(value, dict):
+        raise TypeError(
+            _DICT_TYPE_ERROR_TEMPLATE.format(name=name, value_type=type(value))
+        )
+
+
+def _check_int_arg(name: str, value: Any) -> None:
+    """Raise TypeError if a truthy "value" is not an integer."""
+    if value and not isinstance(value, int):
+        raise TypeError(
+            _INT_TYPE_ERROR_TEMPLATE.format(name=name, value_type=type(value))
+        )
+
+
 def _get_fluent_batch_request_class() -> Type[FluentBatchRequest]:
     """Using this function helps work around circular import dependncies."""
     module_name = "great_expectations.datasource.fluent.interfaces"
@@ -60,7 +177,11 @@ def _get_fluent_batch_class() -> Type[FluentBatch]:
 
 
 def _get_metrics_calculator_class() -> Type[MetricsCalculator]:
-    """Using this function helps work around circular import dependncies."""
+    """Using this function helps work around circular import dependncies.
+
+    Deferring the import to the first "Batch.head()" call also keeps the whole validator module
+    graph out of cold start for the (common) workloads that never inspect batch data directly.
+    """
     module_name = "great_expectations.validator.metrics_calculator"
     class_name = "MetricsCalculator"
     return load_class(class_name=class_name, module_name=module_name)
@@ -91,6 +212,13 @@ class BatchDefinition(SerializableDictDot):
         BatchDefinition
     """
 
+    # The memoization fields below are implementation details and must not surface in the
+    # generic "DictDot" property enumeration.
+    exclude_field_names: Set[str] = {
+        "cached_id",
+        "cached_hash",
+    }
+
     def __init__(
         self,
         datasource_name: str,
@@ -99,21 +227,32 @@ class BatchDefinition(SerializableDictDot):
         batch_identifiers: IDDict,
         batch_spec_passthrough: Optional[dict] = None,
     ) -> None:
-        self._validate_batch_definition(
-            datasource_name=datasource_name,
-            data_connector_name=data_connector_name,
-            data_asset_name=data_asset_name,
-            batch_identifiers=batch_identifiers,
-        )
-
-        assert type(batch_identifiers) == IDDict
+        # Runtime type validation duplicates what static type checkers enforce; it is stripped
+        # (along with its argument-marshalling overhead) under "python -O", which is recommended
+        # for workloads that construct large numbers of these objects.
+        if __debug__:
+            self._validate_batch_definition(
+                datasource_name=datasource_name,
+                data_connector_name=data_connector_name,
+                data_asset_name=data_asset_name,
+                batch_identifiers=batch_identifiers,
+            )
 
-        self._datasource_name = datasource_name
-        self._data_connector_name = data_connector_name
-        self._data_asset_name = data_asset_name
+        self._datasource_name = _intern_if_str(value=datasource_name)
+        self._data_connector_name = _intern_if_str(value=data_connector_name)
+        self._data_asset_name = _intern_if_str(value=data_asset_name)
         self._batch_identifiers = batch_identifiers
         self._batch_spec_passthrough = batch_spec_passthrough
 
+        # Computing "id" (and its hash) requires a full JSON serialization pass; since the
+        # initialization arguments are immutable in practice, both are memoized on first access.
+        self._cached_id: Optional[str] = None
+        self._cached_hash: Optional[int] = None
+
+    def _invalidate_cache(self) -> None:
+        self._cached_id = None
+        self._cached_hash = None
+
     @public_api
     def to_json_dict(self) -> Dict[str, JSONValues]:
         """Returns a JSON-serializable dict representation of this BatchDefinition.
@@ -121,16 +260,23 @@ class BatchDefinition(SerializableDictDot):
         Returns:
             A JSON-serializable dict representation of this BatchDefinition.
         """
+        # The three name fields are validated strings, so only the nested dicts (whose values may
+        # carry numpy/datetime scalars from partition definitions) need the recursive
+        # "convert_to_json_serializable" treatment; the wrapper dict is built directly.
         fields_dict: dict = {
             "datasource_name": self._datasource_name,
             "data_connector_name": self._data_connector_name,
             "data_asset_name": self._data_asset_name,
-            "batch_identifiers": self._batch_identifiers,
+            "batch_identifiers": convert_to_json_serializable(
+                data=self._batch_identifiers
+            ),
         }
         if self._batch_spec_passthrough:
-            fields_dict["batch_spec_passthrough"] = self._batch_spec_passthrough
+            fields_dict["batch_spec_passthrough"] = convert_to_json_serializable(
+                data=self._batch_spec_passthrough
+            )
 
-        return convert_to_json_serializable(data=fields_dict)
+        return fields_dict
 
     def __repr__(self) -> str:
         doc_fields_dict: dict = {
@@ -148,35 +294,25 @@ class BatchDefinition(SerializableDictDot):
         data_asset_name: str,
         batch_identifiers: IDDict,
     ) -> None:
-        if datasource_name is None:
-            raise ValueError("A valid datasource must be specified.")
-        if datasource_name and not isinstance(datasource_name, str):
-            raise TypeError(
-                f"""The type of an datasource name must be a string (Python "str").  The type given is
-"{str(type(datasource_name))}", which is illegal.
-            """
-            )
-        if data_connector_name is None:
-            raise ValueError("A valid data_connector must be specified.")
-        if data_connector_name and not isinstance(data_connector_name, str):
-            raise TypeError(
-                f"""The type of a data_connector name must be a string (Python "str").  The type given is
-"{str(type(data_connector_name))}", which is illegal.
-                """
-            )
-        if data_asset_name is None:
-            raise ValueError("A valid data_asset_name must be specified.")
-        if data_asset_name and not isinstance(data_asset_name, str):
-            raise TypeError(
-                f"""The type of a data_asset name must be a string (Python "str").  The type given is
-"{str(type(data_asset_name))}", which is illegal.
-                """
-            )
-        if batch_identifiers and not isinstance(batch_identifiers, IDDict):
+        name: str
+        display_name: str
+        value: Any
+        for name, display_name, value in (
+            ("an datasource name", "datasource", datasource_name),
+            ("a data_connector name", "data_connector", data_connector_name),
+            ("a data_asset name", "data_asset_name", data_asset_name),
+        ):
+            if value is None:
+                raise ValueError(f"A valid {display_name} must be specified.")
+            _check_str_arg(name=name, value=value)
+
+        # The API contract requires exactly IDDict (the assert formerly in "__init__" already
+        # rejected subclasses), and an identity comparison of the type is cheaper than isinstance.
+        if type(batch_identifiers) is not IDDict:
             raise TypeError(
-                f"""The type of batch_identifiers must be an IDDict object.  The type given is \
-"{str(type(batch_identifiers))}", which is illegal.
-"""
+                _BATCH_IDENTIFIERS_TYPE_ERROR_TEMPLATE.format(
+                    value_type=type(batch_identifiers)
+                )
             )
 
     @property
@@ -202,24 +338,51 @@ class BatchDefinition(SerializableDictDot):
     @batch_spec_passthrough.setter
     def batch_spec_passthrough(self, batch_spec_passthrough: Optional[dict]) -> None:
         self._batch_spec_passthrough = batch_spec_passthrough
+        self._invalidate_cache()
 
     @property
     def id(self) -> str:
-        return IDDict(self.to_json_dict()).to_id()
+        if self._cached_id is None:
+            # "to_json_dict()" always yields at least the three name fields plus
+            # "batch_identifiers", so the multi-key digest of "IDDict.to_id()" applies.
+            self._cached_id = _id_from_json_dict(json_dict=self.to_json_dict())
+        return self._cached_id
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             # Delegate comparison to the other instance's __eq__.
             return NotImplemented
-        return self.id == other.id
+        # Comparing the identifying fields directly is equivalent to (but much cheaper than)
+        # comparing "id" values, which would serialize and hash the JSON form of both sides.
+        return (
+            self._datasource_name,
+            self._data_connector_name,
+            self._data_asset_name,
+            self._batch_identifiers,
+        ) == (
+            other._datasource_name,
+            other._data_connector_name,
+            other._data_asset_name,
+            other._batch_identifiers,
+        )
 
     def __str__(self):
-        return json.dumps(self.to_json_dict(), indent=2)
+        return _dumps_indented(self.to_json_dict())
 
     def __hash__(self) -> int:
         """Overrides the default implementation"""
-        _result_hash: int = hash(self.id)
-        return _result_hash
+        # Hashes the same tuple of identifying fields that "__eq__" compares, keeping the two
+        # consistent while avoiding the full JSON serialization behind "id".
+        if self._cached_hash is None:
+            self._cached_hash = hash(
+                (
+                    self._datasource_name,
+                    self._data_connector_name,
+                    self._data_asset_name,
+                    self._batch_identifiers,
+                )
+            )
+        return self._cached_hash
 
 
 class BatchRequestBase(SerializableDictDot):
@@ -242,6 +405,14 @@ class BatchRequestBase(SerializableDictDot):
     validation (described above plus additional attribute validation) so as to formally validate user specified fields.
     """
 
+    # The memoization fields below are implementation details and must not surface in the
+    # generic "DictDot" property enumeration.
+    exclude_field_names: Set[str] = {
+        "cached_id",
+        "cached_json_dict",
+        "cached_batch_data_id",
+    }
+
     def __init__(
         self,
         datasource_name: str,
@@ -253,9 +424,9 @@ class BatchRequestBase(SerializableDictDot):
         batch_identifiers: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
     ) -> None:
-        self._datasource_name = datasource_name
-        self._data_connector_name = data_connector_name
-        self._data_asset_name = data_asset_name
+        self._datasource_name = _intern_if_str(value=datasource_name)
+        self._data_connector_name = _intern_if_str(value=data_connector_name)
+        self._data_asset_name = _intern_if_str(value=data_asset_name)
         self._data_connector_query = data_connector_query
         self._limit = limit
 
@@ -263,6 +434,17 @@ class BatchRequestBase(SerializableDictDot):
         self._batch_identifiers = batch_identifiers
         self._batch_spec_passthrough = batch_spec_passthrough
 
+        # Computing "id" (and the underlying JSON dict) requires a full serialization pass; both
+        # are memoized and invalidated whenever one of the property setters below is exercised.
+        self._cached_id: Optional[str] = None
+        self._cached_json_dict: Optional[dict] = None
+        self._cached_batch_data_id: Optional[int] = None
+
+    def _invalidate_cache(self) -> None:
+        self._cached_id = None
+        self._cached_json_dict = None
+        self._cached_batch_data_id = None
+
     @property
     def datasource_name(self) -> str:
         return self._datasource_name
@@ -270,6 +452,7 @@ class BatchRequestBase(SerializableDictDot):
     @datasource_name.setter
     def datasource_name(self, value: str) -> None:
         self._datasource_name = value
+        self._invalidate_cache()
 
     @property
     def data_connector_name(self) -> str:
@@ -278,6 +461,7 @@ class BatchRequestBase(SerializableDictDot):
     @data_connector_name.setter
     def data_connector_name(self, value: str) -> None:
         self._data_connector_name = value
+        self._invalidate_cache()
 
     @property
     def data_asset_name(self) -> str:
@@ -286,6 +470,7 @@ class BatchRequestBase(SerializableDictDot):
     @data_asset_name.setter
     def data_asset_name(self, data_asset_name) -> None:
         self._data_asset_name = data_asset_name
+        self._invalidate_cache()
 
     @property
     def data_connector_query(self) -> dict:
@@ -294,6 +479,7 @@ class BatchRequestBase(SerializableDictDot):
     @data_connector_query.setter
     def data_connector_query(self, value: dict) -> None:
         self._data_connector_query = value
+        self._invalidate_cache()
 
     @property
     def limit(self) -> int:
@@ -302,6 +488,7 @@ class BatchRequestBase(SerializableDictDot):
     @limit.setter
     def limit(self, value: int) -> None:
         self._limit = value
+        self._invalidate_cache()
 
     @property
     def runtime_parameters(self) -> dict:
@@ -310,6 +497,7 @@ class BatchRequestBase(SerializableDictDot):
     @runtime_parameters.setter
     def runtime_parameters(self, value: dict) -> None:
         self._runtime_parameters = value
+        self._invalidate_cache()
 
     @property
     def batch_identifiers(self) -> dict:
@@ -318,6 +506,7 @@ class BatchRequestBase(SerializableDictDot):
     @batch_identifiers.setter
     def batch_identifiers(self, value: dict) -> None:
         self._batch_identifiers = value
+        self._invalidate_cache()
 
     @property
     def batch_spec_passthrough(self) -> dict:
@@ -326,10 +515,15 @@ class BatchRequestBase(SerializableDictDot):
     @batch_spec_passthrough.setter
     def batch_spec_passthrough(self, value: dict) -> None:
         self._batch_spec_passthrough = value
+        self._invalidate_cache()
 
     @property
     def id(self) -> str:
-        return IDDict(self.to_json_dict()).to_id()
+        if self._cached_id is None:
+            # "to_json_dict()" always yields at least the three name fields, so the multi-key
+            # digest of "IDDict.to_id()" applies.
+            self._cached_id = _id_from_json_dict(json_dict=self.to_json_dict())
+        return self._cached_id
 
     def to_dict(self) -> dict:
         return standardize_batch_request_display_ordering(
@@ -354,20 +548,53 @@ class BatchRequestBase(SerializableDictDot):
         # if batch_data appears in BatchRequest, temporarily replace it with
         # str placeholder before calling convert_to_json_serializable so that
         # batch_data is not serialized
-        if batch_request_contains_batch_data(batch_request=self):
-            batch_data: Union[BatchRequestBase, dict] = self.runtime_parameters[
-                "batch_data"
-            ]
-            self.runtime_parameters["batch_data"]: str = str(type(batch_data))
-            serializeable_dict: dict = convert_to_json_serializable(data=self.to_dict())
-            # after getting serializable_dict, restore original batch_data
-            self.runtime_parameters["batch_data"]: Union[
-                BatchRequestBase, dict
-            ] = batch_data
+        # The result is memoized: the cache is cleared by every property setter, and -- because
+        # "batch_data" is mutable and excluded from serialization -- additionally keyed on the
+        # identity of the "batch_data" object, so replacing it externally invalidates correctly.
+        batch_data: Optional[Union[BatchRequestBase, dict]] = (
+            self._runtime_parameters.get("batch_data")
+            if isinstance(self._runtime_parameters, dict)
+            else None
+        )
+        batch_data_id: Optional[int] = (
+            id(batch_data) if batch_data is not None else None
+        )
+        if (
+            self._cached_json_dict is not None
+            and self._cached_batch_data_id == batch_data_id
+        ):
+            return self._cached_json_dict
+
+        # NOTE: "convert_to_json_serializable" rebuilds every container it encounters, so the
+        # "safe_deep_copy" pass that "standardize_batch_request_display_ordering()" performs inside
+        # "to_dict()" would be redundant here; the top-level keys are reordered after conversion
+        # instead.  This eliminates the dominant allocation of "to_json_dict()", which is exercised
+        # on every "id" access.
+        if batch_data is not None:
+            # temporarily replace "batch_data" with a str placeholder so that it is not
+            # serialized; operating on a local reference avoids re-resolving the
+            # "runtime_parameters" property (and re-hashing the key) for the swap and restore,
+            # and try/finally guarantees the original object is put back even if serialization
+            # raises.
+            runtime_parameters: dict = self._runtime_parameters
+            runtime_parameters["batch_data"] = str(type(batch_data))
+            try:
+                serializeable_dict: dict = convert_to_json_serializable(
+                    data=super().to_dict()
+                )
+            finally:
+                runtime_parameters["batch_data"] = batch_data
         else:
-            serializeable_dict: dict = convert_to_json_serializable(data=self.to_dict())
+            serializeable_dict: dict = convert_to_json_serializable(
+                data=super().to_dict()
+            )
+
+        self._cached_json_dict = _reorder_batch_request_keys(
+            batch_request_as_dict=serializeable_dict
+        )
+        self._cached_batch_data_id = batch_data_id
 
-        return serializeable_dict
+        return self._cached_json_dict
 
     def __deepcopy__(self, memo):
         cls = self.__class__
@@ -375,8 +602,23 @@ class BatchRequestBase(SerializableDictDot):
 
         memo[id(self)] = result
 
-        for key, value in self.to_raw_dict().items():
-            value_copy = safe_deep_copy(data=value, memo=memo)
+        # Copy the instance attributes directly: "to_raw_dict()" would run "safe_deep_copy" over
+        # the whole attribute dict before the per-value copy below, deep-copying everything twice.
+        for key, value in self.__dict__.items():
+            if key == "_runtime_parameters" and isinstance(value, dict):
+                # "batch_data" is a handle to external data (dataframe, SQLAlchemy object,
+                # BatchData wrapper) that is large and/or unpickleable; it is always handed off by
+                # reference, while the remaining runtime_parameters are deep-copied.
+                # ("safe_deep_copy" would do this on its own only for Pandas/Spark dataframes.)
+                value_copy = {
+                    parameter_name: parameter_value
+                    if parameter_name == "batch_data"
+                    else safe_deep_copy(data=parameter_value, memo=memo)
+                    for parameter_name, parameter_value in value.items()
+                }
+            else:
+                value_copy = safe_deep_copy(data=value, memo=memo)
+
             setattr(result, key, value_copy)
 
         return result
@@ -396,12 +638,12 @@ class BatchRequestBase(SerializableDictDot):
         location of the "great_expectations/types/__init__.py" and "great_expectations/core/util.py" modules make this
         refactoring infeasible at the present time.
         """
-        json_dict: dict = self.to_json_dict()
-        deep_filter_properties_iterable(
-            properties=json_dict,
-            inplace=True,
+        # The dict returned by "to_json_dict()" may be the memoized copy, so it must not be
+        # filtered in place.
+        json_dict: dict = deep_filter_properties_iterable(
+            properties=self.to_json_dict(),
         )
-        return json.dumps(json_dict, indent=2)
+        return _dumps_indented(json_dict)
 
     def __str__(self) -> str:
         """
@@ -422,37 +664,18 @@ class BatchRequestBase(SerializableDictDot):
         limit: Optional[int] = None,
     ) -> None:
         # TODO test and check all logic in this validator!
-        if not (datasource_name and isinstance(datasource_name, str)):
-            raise TypeError(
-                f"""The type of an datasource name must be a string (Python "str").  The type given is
-"{str(type(datasource_name))}", which is illegal.
-            """
-            )
-        if not (data_connector_name and isinstance(data_connector_name, str)):
-            raise TypeError(
-                f"""The type of data_connector name must be a string (Python "str").  The type given is
-"{str(type(data_connector_name))}", which is illegal.
-                """
-            )
-        if not (data_asset_name and isinstance(data_asset_name, str)):
-            raise TypeError(
-                f"""The type of data_asset name must be a string (Python "str").  The type given is
-        "{str(type(data_asset_name))}", which is illegal.
-                        """
-            )
+        name: str
+        value: Any
+        for name, value in (
+            ("an datasource name", datasource_name),
+            ("data_connector name", data_connector_name),
+            ("data_asset name", data_asset_name),
+        ):
+            _check_str_arg(name=name, value=value, required=True)
+
         # TODO Abe 20201015: Switch this to DataConnectorQuery.
-        if data_connector_query and not isinstance(data_connector_query, dict):
-            raise TypeError(
-                f"""The type of data_connector_query must be a dict object.  The type given is
-"{str(type(data_connector_query))}", which is illegal.
-                """
-            )
-        if limit and not isinstance(limit, int):
-            raise TypeError(
-                f"""The type of limit must be an integer (Python "int").  The type given is "{str(type(limit))}", which
-is illegal.
-                """
-            )
+        _check_dict_arg(name="data_connector_query", value=data_connector_query)
+        _check_int_arg(name="limit", value=limit)
 
 
 @public_api
@@ -514,13 +737,17 @@ class BatchRequest(BatchRequestBase):
         limit: Optional[int] = None,
         batch_spec_passthrough: Optional[dict] = None,
     ) -> None:
-        self._validate_init_parameters(
-            datasource_name=datasource_name,
-            data_connector_name=data_connector_name,
-            data_asset_name=data_asset_name,
-            data_connector_query=data_connector_query,
-            limit=limit,
-        )
+        # Runtime type validation duplicates what static type checkers enforce; it is stripped
+        # under "python -O", which is recommended for workloads that construct large numbers of
+        # BatchRequests (e.g., partition enumeration and profiling).
+        if __debug__:
+            self._validate_init_parameters(
+                datasource_name=datasource_name,
+                data_connector_name=data_connector_name,
+                data_asset_name=data_asset_name,
+                data_connector_query=data_connector_query,
+                limit=limit,
+            )
         super().__init__(
             datasource_name=datasource_name,
             data_connector_name=data_connector_name,
@@ -590,16 +817,20 @@ class RuntimeBatchRequest(BatchRequestBase):
         batch_identifiers: dict,
         batch_spec_passthrough: Optional[dict] = None,
     ) -> None:
-        self._validate_init_parameters(
-            datasource_name=datasource_name,
-            data_connector_name=data_connector_name,
-            data_asset_name=data_asset_name,
-        )
-        self._validate_runtime_batch_request_specific_init_parameters(
-            runtime_parameters=runtime_parameters,
-            batch_identifiers=batch_identifiers,
-            batch_spec_passthrough=batch_spec_passthrough,
-        )
+        # Runtime type validation duplicates what static type checkers enforce; it is stripped
+        # under "python -O", which is recommended for workloads that construct large numbers of
+        # BatchRequests (e.g., partition enumeration and profiling).
+        if __debug__:
+            self._validate_init_parameters(
+                datasource_name=datasource_name,
+                data_connector_name=data_connector_name,
+                data_asset_name=data_asset_name,
+            )
+            self._validate_runtime_batch_request_specific_init_parameters(
+                runtime_parameters=runtime_parameters,
+                batch_identifiers=batch_identifiers,
+                batch_spec_passthrough=batch_spec_passthrough,
+            )
         super().__init__(
             datasource_name=datasource_name,
             data_connector_name=data_connector_name,
@@ -617,21 +848,23 @@ class RuntimeBatchRequest(BatchRequestBase):
     ) -> None:
         if not (runtime_parameters and (isinstance(runtime_parameters, dict))):
             raise TypeError(
-                f"""The runtime_parameters must be a non-empty dict object.
-                The type given is "{str(type(runtime_parameters))}", which is an illegal type or an empty dictionary."""
+                _RUNTIME_PARAMETERS_TYPE_ERROR_TEMPLATE.format(
+                    value_type=type(runtime_parameters)
+                )
             )
 
         if not (batch_identifiers and isinstance(batch_identifiers, dict)):
             raise TypeError(
-                f"""The type for batch_identifiers must be a dict object, with keys being identifiers defined in the
-                data connector configuration.  The type given is "{str(type(batch_identifiers))}", which is illegal."""
+                _RUNTIME_BATCH_IDENTIFIERS_TYPE_ERROR_TEMPLATE.format(
+                    value_type=type(batch_identifiers)
+                )
             )
 
         if batch_spec_passthrough and not (isinstance(batch_spec_passthrough, dict)):
             raise TypeError(
-                f"""The type for batch_spec_passthrough must be a dict object. The type given is \
-"{str(type(batch_spec_passthrough))}", which is illegal.
-"""
+                _BATCH_SPEC_PASSTHROUGH_TYPE_ERROR_TEMPLATE.format(
+                    value_type=type(batch_spec_passthrough)
+                )
             )
 
 
@@ -652,6 +885,11 @@ class BatchMarkers(BatchKwargs):
 
 
 class BatchData:
+    # NOTE: Unlike the "DictDot"-based classes in this module (whose dictionary-style protocol
+    # requires a per-instance "__dict__"), BatchData can use "__slots__" to reduce the per-instance
+    # memory footprint and speed up attribute access for workloads that materialize many batches.
+    __slots__ = ("_execution_engine",)
+
     def __init__(self, execution_engine) -> None:
         self._execution_engine = execution_engine
 
@@ -705,6 +943,13 @@ class Batch(SerializableDictDot):
         Batch instance created.
     """
 
+    # The memoization fields below are implementation details and must not surface in the
+    # generic "DictDot" property enumeration.
+    exclude_field_names: Set[str] = {
+        "batch_definition_is_batch_definition",
+        "cached_id",
+    }
+
     def __init__(
         self,
         data: Optional[BatchDataType] = None,
@@ -728,6 +973,14 @@ class Batch(SerializableDictDot):
             batch_definition = IDDict()
 
         self._batch_definition = batch_definition
+        # Precomputed here (and in the "batch_definition" setter) so that serialization paths do
+        # not repeat the isinstance check on every call.
+        self._batch_definition_is_batch_definition: bool = isinstance(
+            batch_definition, BatchDefinition
+        )
+        # "id" is derived from "batch_definition" and queried repeatedly (e.g., as the "batch_id"
+        # domain key during metric resolution), so it is memoized on first access.
+        self._cached_id: Optional[str] = None
 
         if batch_spec is None:
             batch_spec = BatchSpec()
@@ -736,11 +989,7 @@ class Batch(SerializableDictDot):
 
         if batch_markers is None:
             batch_markers = BatchMarkers(
-                {
-                    "ge_load_time": datetime.datetime.now(
-                        datetime.timezone.utc
-                    ).strftime("%Y%m%dT%H%M%S.%fZ")
-                }
+                {"ge_load_time": _batch_markers_ge_load_time()}
             )
 
         self._batch_markers = batch_markers
@@ -776,6 +1025,10 @@ class Batch(SerializableDictDot):
     @batch_definition.setter
     def batch_definition(self, batch_definition) -> None:
         self._batch_definition = batch_definition
+        self._batch_definition_is_batch_definition = isinstance(
+            batch_definition, BatchDefinition
+        )
+        self._cached_id = None
 
     @property
     def batch_spec(self):
@@ -806,8 +1059,8 @@ class Batch(SerializableDictDot):
         dict_obj: dict = {
             "data": str(self.data),
             "batch_request": self.batch_request.to_dict(),
-            "batch_definition": self.batch_definition.to_json_dict()
-            if isinstance(self.batch_definition, BatchDefinition)
+            "batch_definition": self._batch_definition.to_json_dict()
+            if self._batch_definition_is_batch_definition
             else {},
             "batch_spec": self.batch_spec,
             "batch_markers": self.batch_markers,
@@ -830,8 +1083,13 @@ class Batch(SerializableDictDot):
 
     @property
     def id(self):
+        if self._cached_id is None:
+            self._cached_id = self._compute_id()
+        return self._cached_id
+
+    def _compute_id(self):
         batch_definition = self._batch_definition
-        if isinstance(batch_definition, BatchDefinition):
+        if self._batch_definition_is_batch_definition:
             return batch_definition.id
 
         if isinstance(batch_definition, IDDict):
@@ -843,7 +1101,7 @@ class Batch(SerializableDictDot):
         return IDDict({}).to_id()
 
     def __str__(self):
-        return json.dumps(self.to_json_dict(), indent=2)
+        return _dumps_indented(self.to_json_dict())
 
     @public_api
     def head(self, n_rows=5, fetch_all=False):
@@ -1009,17 +1267,22 @@ def get_batch_request_from_acceptable_arguments(  # noqa: C901 - complexity 21
             f"the first parameter, datasource_name, must be a str, not {type(datasource_name)}"
         )
 
-    if len([arg for arg in [batch_data, query, path] if arg is not None]) > 1:
+    # Encode which of the mutually exclusive runtime arguments are set as a bitmask; a value with
+    # more than one bit set fails the "flags & (flags - 1)" check.  This avoids the list
+    # allocations of the previous "len([arg for arg in [...] if arg is not None]) > 1" and
+    # "any([...])" patterns on a hot construction path.
+    runtime_args_flags: int = (
+        (batch_data is not None)
+        | ((query is not None) << 1)
+        | ((path is not None) << 2)
+    )
+    if runtime_args_flags & (runtime_args_flags - 1):
         raise ValueError("Must provide only one of batch_data, query, or path.")
 
-    if any(
-        [
-            batch_data is not None
-            and runtime_parameters
-            and "batch_data" in runtime_parameters,
-            query and runtime_parameters and "query" in runtime_parameters,
-            path and runtime_parameters and "path" in runtime_parameters,
-        ]
+    if runtime_parameters and (
+        (batch_data is not None and "batch_data" in runtime_parameters)
+        or (query and "query" in runtime_parameters)
+        or (path and "path" in runtime_parameters)
     ):
         raise ValueError(
             "If batch_data, query, or path arguments are provided, the same keys cannot appear in the "
@@ -1033,7 +1296,7 @@ def get_batch_request_from_acceptable_arguments(  # noqa: C901 - complexity 21
     batch_request_class: type
     batch_request_as_dict: dict
 
-    if any([batch_data is not None, query, path, runtime_parameters]):
+    if batch_data is not None or query or path or runtime_parameters:
         batch_request_class = RuntimeBatchRequest
 
         runtime_parameters = runtime_parameters or {}
@@ -1130,53 +1393,37 @@ def get_batch_request_from_acceptable_arguments(  # noqa: C901 - complexity 21
 def standardize_batch_request_display_ordering(
     batch_request: Dict[str, Union[str, int, Dict[str, Any]]]
 ) -> Dict[str, Union[str, Dict[str, Any]]]:
-    batch_request_as_dict: Union[str, Dict[str, Any]] = safe_deep_copy(
-        data=batch_request
+    return _reorder_batch_request_keys(
+        batch_request_as_dict=safe_deep_copy(data=batch_request)
     )
-    datasource_name: str = batch_request_as_dict["datasource_name"]
-    data_connector_name: str = batch_request_as_dict["data_connector_name"]
-    data_asset_name: str = batch_request_as_dict["data_asset_name"]
-    runtime_parameters: str = batch_request_as_dict.get("runtime_parameters")
-    batch_identifiers: str = batch_request_as_dict.get("batch_identifiers")
-    batch_request_as_dict.pop("datasource_name")
-    batch_request_as_dict.pop("data_connector_name")
-    batch_request_as_dict.pop("data_asset_name")
-    # NOTE: AJB 20211217 The below conditionals should be refactored
+
+
+def _reorder_batch_request_keys(
+    batch_request_as_dict: Dict[str, Union[str, int, Dict[str, Any]]]
+) -> Dict[str, Union[str, Dict[str, Any]]]:
+    """Return a new dict with the standard batch_request keys moved to the front.
+
+    Unlike "standardize_batch_request_display_ordering()", this helper neither copies nor mutates
+    the values of its argument; callers that hand the result to external consumers must copy first.
+    """
+    reordered_batch_request: Dict[str, Union[str, int, Dict[str, Any]]] = {
+        "datasource_name": batch_request_as_dict["datasource_name"],
+        "data_connector_name": batch_request_as_dict["data_connector_name"],
+        "data_asset_name": batch_request_as_dict["data_asset_name"],
+    }
+
+    runtime_parameters = batch_request_as_dict.get("runtime_parameters")
     if runtime_parameters is not None:
-        batch_request_as_dict.pop("runtime_parameters")
+        reordered_batch_request["runtime_parameters"] = runtime_parameters
+
+    batch_identifiers = batch_request_as_dict.get("batch_identifiers")
     if batch_identifiers is not None:
-        batch_request_as_dict.pop("batch_identifiers")
-    if runtime_parameters is not None and batch_identifiers is not None:
-        batch_request_as_dict = {
-            "datasource_name": datasource_name,
-            "data_connector_name": data_connector_name,
-            "data_asset_name": data_asset_name,
-            "runtime_parameters": runtime_parameters,
-            "batch_identifiers": batch_identifiers,
-            **batch_request_as_dict,
-        }
-    elif runtime_parameters is not None and batch_identifiers is None:
-        batch_request_as_dict = {
-            "datasource_name": datasource_name,
-            "data_connector_name": data_connector_name,
-            "data_asset_name": data_asset_name,
-            "runtime_parameters": runtime_parameters,
-            **batch_request_as_dict,
-        }
-    elif runtime_parameters is None and batch_identifiers is not None:
-        batch_request_as_dict = {
-            "datasource_name": datasource_name,
-            "data_connector_name": data_connector_name,
-            "data_asset_name": data_asset_name,
-            "batch_identifiers": batch_identifiers,
-            **batch_request_as_dict,
-        }
-    else:
-        batch_request_as_dict = {
-            "datasource_name": datasource_name,
-            "data_connector_name": data_connector_name,
-            "data_asset_name": data_asset_name,
-            **batch_request_as_dict,
-        }
+        reordered_batch_request["batch_identifiers"] = batch_identifiers
+
+    key: str
+    value: Union[str, int, Dict[str, Any]]
+    for key, value in batch_request_as_dict.items():
+        if key not in reordered_batch_request:
+            reordered_batch_request[key] = value
 
-    return batch_request_as_dict
+    return reordered_batch_request